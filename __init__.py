@@ -88,4 +88,10 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: MyConfigEntry) -
     # If you have created any custom services, they need to be removed here too.
 
     # Unload platforms and return result
-    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+
+    # Close the BLE connection the coordinator keeps open between polls
+    if unload_ok:
+        await config_entry.runtime_data.coordinator.async_shutdown()
+
+    return unload_ok
@@ -4,20 +4,40 @@ You should create your api seperately and have it hosted on PYPI.  This is inclu
 of making this example code executable.
 """
 
+import importlib
 import logging
 
 from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .renogy.device import RenogyDeviceData
-from .renogy.device_dc_charger import DCChargerDevice
-from .renogy.device_inverter import InverterDevice
-from .renogy.device_shunt import ShuntDevice
-from .renogy.device_test import TestDevice
+from .renogy.device import RenogyDevice, RenogyDeviceData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Module and class to use for each configured device type. Only the module of
+# the configured device is imported, when the first update runs.
+_DEVICE_CLASSES: dict[str, tuple[str, str]] = {
+    "Inverter": (".renogy.device_inverter", "InverterDevice"),
+    "DcDcCharger": (".renogy.device_dc_charger", "DCChargerDevice"),
+    "SmartShunt300": (".renogy.device_shunt", "ShuntDevice"),
+    "TestDevice": (".renogy.device_test", "TestDevice"),
+}
+
+
+async def _async_get_device_class(
+    hass: HomeAssistant, device_type: str
+) -> type[RenogyDevice] | None:
+    """Import and return the device class for a device type."""
+    if device_type not in _DEVICE_CLASSES:
+        return None
+    module_name, class_name = _DEVICE_CLASSES[device_type]
+    # Imports do blocking I/O so they are run in the import executor
+    module = await hass.async_add_import_executor_job(
+        importlib.import_module, module_name, __package__
+    )
+    return getattr(module, class_name)
+
 
 class API:
     """Class for example API."""
@@ -29,30 +49,22 @@ class API:
         self.device_name = None
         self.device_type = device_type
         self.lastUpdateValid: bool = False
+        # The mac never changes for an api instance so the name is built once
+        self._controller_name = "renogy_" + mac.replace(":", "_")
+        # Kept between polls so the BLE connection stays open
+        self.device_instance: RenogyDevice | None = None
 
     # If you want to change this value, also change the device_unique_id in renogy/device.py
     @property
     def controller_name(self) -> str:
         """Return the name of the controller."""
-        return "renogy_" + self.mac.replace(":", "_")
-
-    # def connect(self) -> bool:
-    #     """Connect to api."""
-    #     _LOGGER.debug("Connecting to api with MAC %s", self.mac)
-    #     self.device_name = "RGT_S39E5"
-
-    #     if self.name != "" and self.device_type != "":
-    #         self.connected = True
-    #         return True
-    #     raise APIAuthError("Error connecting to api. Invalid name or device_type.")
+        return self._controller_name
 
-    # def disconnect(self) -> bool:
-    #     """Disconnect from api."""
-    #     self.connected = False
-    #     return True
+    async def poll(self, hass: HomeAssistant) -> list[RenogyDeviceData]:
+        """Poll the devices on api.
 
-    async def get_devices(self, hass: HomeAssistant) -> list[RenogyDeviceData]:
-        """Get devices on api."""
+        The BLE connection is opened on the first poll and reused by the next ones.
+        """
         self.lastUpdateValid = False
 
         ble_device = None
@@ -68,27 +80,15 @@ class API:
         else:
             self.device_name = "Test_A1234"
 
-        devicesRet = []
-        if self.device_type == "Inverter":
-            device_instance = InverterDevice(
+        if self.device_instance is None:
+            device_class = await _async_get_device_class(hass, self.device_type)
+            if device_class is None:
+                raise APIAuthError(f"Unknown device type {self.device_type}")
+            self.device_instance = device_class(
                 mac=self.mac, device_name=self.device_name, name=self.name
             )
-            devicesRet = await device_instance.execute(ble_device)
-        elif self.device_type == "DcDcCharger":
-            device_instance = DCChargerDevice(
-                mac=self.mac, device_name=self.device_name, name=self.name
-            )
-            devicesRet = await device_instance.execute(ble_device)
-        elif self.device_type == "SmartShunt300":
-            device_instance = ShuntDevice(
-                mac=self.mac, device_name=self.device_name, name=self.name
-            )
-            devicesRet = await device_instance.execute(ble_device)
-        elif self.device_type == "TestDevice":
-            device_instance = TestDevice(
-                mac=self.mac, device_name=self.device_name, name=self.name
-            )
-            devicesRet = await device_instance.execute(None)
+
+        devicesRet = await self.device_instance.execute(ble_device)
 
         if len(devicesRet) == 0:
             _LOGGER.error("%s - Getting 0 devices from api: %s", self.name, self.mac)
@@ -96,11 +96,16 @@ class API:
                 f"Could get entities from Renogy device with address {self.mac}"
             )
 
-        _LOGGER.debug("%s - api.get_devices: %s", self.name, devicesRet)
+        _LOGGER.debug("%s - api.poll: %s", self.name, devicesRet)
         self.lastUpdateValid = True
 
         return devicesRet
 
+    async def disconnect(self) -> None:
+        """Close the BLE connection kept open between polls."""
+        if self.device_instance is not None:
+            await self.device_instance.disconnect()
+
 
 class APIAuthError(Exception):
     """Exception class for auth error."""
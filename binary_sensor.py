@@ -32,7 +32,7 @@ async def async_setup_entry(
     # to a list for each one.
     # This maybe different in your specific case, depending on how your data is structured
     binary_sensors = [
-        BinarySensor1(coordinator, device)
+        RenogyBinarySensor(coordinator, device)
         for device in coordinator.data.devices
         if device.device_type == RenogyDeviceType.DOOR_SENSOR
     ]
@@ -41,9 +41,12 @@ async def async_setup_entry(
     async_add_entities(binary_sensors)
 
 
-class BinarySensor1(CoordinatorEntity, BinarySensorEntity):
+class RenogyBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Implementation of a sensor."""
 
+    # https://developers.home-assistant.io/docs/core/entity/binary-sensor#available-device-classes
+    _attr_device_class = BinarySensorDeviceClass.DOOR
+
     def __init__(
         self, coordinator: RenogyCoordinator, device: RenogyDeviceData
     ) -> None:
@@ -51,62 +54,45 @@ class BinarySensor1(CoordinatorEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self.device = device
         self.device_id = device.device_id
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
-        # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device_by_unique_id(
-            self.device.device_unique_id
-        )
-        #_LOGGER.debug("Update Device: %s", self.device)
-        self.async_write_ha_state()
-
-    @property
-    def device_class(self) -> str:
-        """Return device class."""
-        # https://developers.home-assistant.io/docs/core/entity/binary-sensor#available-device-classes
-        return BinarySensorDeviceClass.DOOR
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
+        # All entities must have a unique id.  Think carefully what you want this to be as
+        # changing it later will cause HA to create new entities.
+        self._attr_unique_id = f"{DOMAIN}-{device.device_unique_id}"
         # Identifiers are what group entities into the same device.
         # If your device is created elsewhere, you can just specify the indentifiers parameter.
         # If your device connects via another device, add via_device parameter with the indentifiers of that device.
-        return DeviceInfo(
-            name=f"Renogy {self.coordinator.device_name}",
+        self._attr_device_info = DeviceInfo(
+            name=f"Renogy {coordinator.device_name}",
             manufacturer="Renogy",
-            model=self.coordinator.data.device_type,
+            model=coordinator.data.device_type,
             sw_version="1.0",
             identifiers={
                 (
                     DOMAIN,
-                    f"{self.coordinator.data.controller_name}-{self.device.device_id}",
+                    f"{coordinator.data.controller_name}-{device.device_id}",
                 )
             },
         )
+        self._update_attributes()
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self.device.name
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update sensor with latest data from coordinator."""
+        # This method is called by your DataUpdateCoordinator when a successful update runs.
+        device = self.coordinator.get_device_by_unique_id(
+            self.device.device_unique_id
+        )
+        # A device that dropped out of this update keeps its last state
+        if device is not None:
+            self.device = device
+            self._update_attributes()
+        #_LOGGER.debug("Update Device: %s", self.device)
+        self.async_write_ha_state()
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return if the binary sensor is on."""
+    def _update_attributes(self) -> None:
+        """Copy the device data to the entity attributes."""
+        # Unique ids are positional, the entity behind one can be renamed
+        self._attr_name = self.device.name
         # This needs to enumerate to true or false
-        return self.device.state
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique id."""
-        # All entities must have a unique id.  Think carefully what you want this to be as
-        # changing it later will cause HA to create new entities.
-        return f"{DOMAIN}-{self.device.device_unique_id}"
-
-    @property
-    def extra_state_attributes(self):
-        """Return the extra state attributes."""
+        self._attr_is_on = self.device.state
         # Add any additional attributes you want on your sensor.
-        return self.device.attributes
+        self._attr_extra_state_attributes = self.device.attributes
@@ -52,6 +52,14 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Bluetooth name prefix of each device type, also listed in manifest.json
+_PREFIX_TO_TYPE = (
+    ("RTMShunt", "SmartShunt300"),
+    ("BT-TH-", "DcDcCharger"),
+    ("RNGRIU", "Inverter"),
+)
+
+
 class RenogyBluetoothDeviceUpdateError(Exception):
     """Custom error class for device updates."""
 
@@ -120,14 +128,15 @@ class RBConfigFlow(ConfigFlow, domain=DOMAIN):
         retData[CONF_NAME] = ble_device.name
         retData[CONF_MAC] = ble_device.address
 
-        if ble_device.name.startswith("RTMShunt"):
-            retData[CONF_TYPE] = "SmartShunt300"
-        elif ble_device.name.startswith("BT-TH-"):
-            retData[CONF_TYPE] = "DcDcCharger"
-        elif ble_device.name.startswith("RNGRIU"):
-            retData[CONF_TYPE] = "Inverter"
-        else:
-            retData[CONF_TYPE] = "Unknown"
+        name = ble_device.name
+        retData[CONF_TYPE] = next(
+            (
+                device_type
+                for prefix, device_type in _PREFIX_TO_TYPE
+                if name.startswith(prefix)
+            ),
+            "Unknown",
+        )
 
         return retData
 
@@ -152,9 +161,10 @@ class RBConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Confirm discovery."""
-        _LOGGER.debug("async_step_bluetooth_confirm - %s", user_input)
-        _LOGGER.debug("async_step_bluetooth_confirm curr ids - %s", self._async_current_ids())
-        _LOGGER.debug("async_step_bluetooth_confirm discov - %s", self._discovered_device)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("async_step_bluetooth_confirm - %s", user_input)
+            _LOGGER.debug("async_step_bluetooth_confirm curr ids - %s", self._async_current_ids())
+            _LOGGER.debug("async_step_bluetooth_confirm discov - %s", self._discovered_device)
 
         if user_input is not None:
             return self.async_create_entry(
@@ -195,8 +205,9 @@ class RBConfigFlow(ConfigFlow, domain=DOMAIN):
         # Called when you initiate adding an integration via the UI
         errors: dict[str, str] = {}
 
-        _LOGGER.debug("async_step_user - %s", user_input)
-        _LOGGER.debug("async_step_user current ids - %s", self._async_current_ids())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("async_step_user - %s", user_input)
+            _LOGGER.debug("async_step_user current ids - %s", self._async_current_ids())
 
         if user_input is not None:
             # The form has been filled in and submitted, so process the data provided.
@@ -59,6 +59,13 @@ class RenogyCoordinator(DataUpdateCoordinator):
         # Initialise your api here
         self.api = API(mac=self.mac, name=self.name2, device_type=self.device_type)
 
+        # Lookup table of the last update's devices by device_unique_id
+        self._by_unique_id: dict[str, RenogyDeviceData] = {}
+
+        # controller_name and device_type never change, only the devices are
+        # replaced on each update
+        self._api_data = RenBtApiData(self.api.controller_name, self.device_type, [])
+
     async def async_update_data(self):
         """Fetch data from API endpoint.
 
@@ -69,7 +76,7 @@ class RenogyCoordinator(DataUpdateCoordinator):
             # if not self.api.connected:
             #     await self.hass.async_add_executor_job(self.api.connect)
             # devices = await self.hass.async_add_executor_job(self.api.get_devices)
-            devices = await self.api.get_devices(self.hass)
+            devices = await self.api.poll(self.hass)
             self.device_name = self.api.device_name
         except APIAuthError as err:
             _LOGGER.error(err)
@@ -78,18 +85,21 @@ class RenogyCoordinator(DataUpdateCoordinator):
             # This will show entities as unavailable by raising UpdateFailed exception
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+        self._by_unique_id = {device.device_unique_id: device for device in devices}
+
         # What is returned here is stored in self.data by the DataUpdateCoordinator
-        return RenBtApiData(self.api.controller_name, self.device_type, devices)
+        self._api_data.devices = devices
+        return self._api_data
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled call and close the BLE connection."""
+        await super().async_shutdown()
+        await self.api.disconnect()
 
     def get_device_by_unique_id(self, unique_id: str) -> RenogyDeviceData | None:
         """Return device by device id."""
         # Called by the sensors and sensors to get their updated data from self.data
-        try:
-            return [
-                device
-                for device in self.data.devices
-                if device.device_unique_id == unique_id
-            ][0]
-        except IndexError as err:
-            _LOGGER.error(err)
-            return None
+        device = self._by_unique_id.get(unique_id)
+        if device is None:
+            _LOGGER.error("No device found with unique id %s", unique_id)
+        return device
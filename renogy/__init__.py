@@ -1,10 +1,30 @@
 """Renogy Bluetooth integration."""
 
+import importlib
+
 from .device import RenogyDevice, RenogyDeviceData, RenogyDeviceType
-from .device_dc_charger import DCChargerDevice
-from .device_inverter import InverterDevice
-from .device_shunt import ShuntDevice
-from .device_test import TestDevice
-from .utils import *
+from .utils import (
+    bytes_to_int,
+    crc16_modbus,
+    filter_fields,
+    format_temperature,
+    int_to_bytes,
+    parse_temperature,
+)
 
 __version__ = "0.0.1"
+
+# Only the module for the configured device is needed, so the device classes
+# are imported on first access
+_DEVICE_MODULES = {
+    "DCChargerDevice": ".device_dc_charger",
+    "InverterDevice": ".device_inverter",
+    "ShuntDevice": ".device_shunt",
+    "TestDevice": ".device_test",
+}
+
+
+def __getattr__(name: str):
+    if name in _DEVICE_MODULES:
+        return getattr(importlib.import_module(_DEVICE_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,19 +6,51 @@ including BLE communication logic, device data models, and abstract parsing meth
 
 import abc
 import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import StrEnum
 import logging
+import struct
+import sys
 import traceback
+from types import MappingProxyType
 
 from bleak import BleakClient, BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
 from bleak_retry_connector import establish_connection
 
-from .utils import bytes_to_int, crc16_modbus, int_to_bytes
+from .utils import crc16_modbus
 
+# The parsers in this package run for every BLE notification. Log with %-style
+# arguments so nothing is formatted unless the level is enabled, never with
+# f-strings, and check isEnabledFor before building hex dumps of a frame.
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to wait for the response to a read request before sending it again
+RESPONSE_TIMEOUT = 2.0
+
+# Connection attempts per poll, and the wait before the first reconnect which
+# doubles after every further failure
+CONNECT_ATTEMPTS = 3
+RECONNECT_DELAY = 2.0
+
+# Modbus address used when a single device is connected to the Bluetooth module
+DEFAULT_DEVICE_ID = 255
+
+# Names of the Home Assistant devices shared by several device types, interned
+# so every entity refers to the same string
+MAIN_BATTERY = sys.intern("Main Battery")
+STARTER_BATTERY = sys.intern("Starter Battery")
+
+# Entity ids of a device are numbered from 1 and stay below this limit
+ENTITY_ID_LIMIT = 64
+
+_EMPTY_ATTRIBUTES = MappingProxyType({})
+
+# Result of parse_section for data that is rejected, shared as callers only read it
+INVALID_SECTION = MappingProxyType({"valid": False, "entities": ()})
+
 
 class RenogyDeviceType(StrEnum):
     """Device types."""
@@ -35,7 +67,7 @@ class RenogyDeviceType(StrEnum):
     INT_DATA = "int_data"
 
 
-@dataclass
+@dataclass(slots=True)
 class RenogyDeviceData:
     """API device."""
 
@@ -46,7 +78,9 @@ class RenogyDeviceData:
     name: str
     state: str | float | int | bool
     is_main: bool = False  # True if this is the main entity for the device
-    attributes: dict = None  # Additional attributes for the entity
+    # Additional attributes for the entity, entities without any share one
+    # read only empty mapping
+    attributes: Mapping = _EMPTY_ATTRIBUTES
 
 
 class RenogyDevice(abc.ABC):
@@ -56,23 +90,67 @@ class RenogyDevice(abc.ABC):
     Child classes must implement the parse_section method to extract device-specific data.
     """
 
-    def __init__(self, mac: str, device_name: str, name: str, device_type: str) -> None:
+    # (register, words) of each section to read, set by the child classes. Shared
+    # by every instance of a class.
+    SECTIONS: tuple[tuple[int, int], ...] = ()
+    # Shortest frame, header included, each section's parser can read. Shorter
+    # frames are dropped before they are parsed.
+    SECTION_MIN_LEN: tuple[int, ...] = ()
+
+    def __init__(
+        self,
+        mac: str,
+        device_name: str,
+        name: str,
+        device_type: str,
+        device_id: int = DEFAULT_DEVICE_ID,
+    ) -> None:
         """Initialise."""
         self.mac = mac
+        # If you want to change this value, also change the controller_name in api.py
+        # The mac never changes for a device instance so the id is built once
+        self._device_unique_id = "renogy_" + mac.lower().replace(":", "_") + "_id"
+        # Unique ids of the device's entities, indexed by entity id
+        self.entity_unique_ids = tuple(
+            f"{self._device_unique_id}_{entity_id}"
+            for entity_id in range(ENTITY_ID_LIMIT)
+        )
         self.device_name = device_name
+        self._stripped_device_name = (device_name or "").strip()
         self.ha_device_name = "Default Device Name"
         self.name = name
         self.device_type = device_type
         self.function = 3
-        self.device_id = 255
-        self.sections = []
+        self.device_id = device_id
         self.section_index = 0
-        self._notification_event = asyncio.Event()  # Add event
+        self.response_timeout = RESPONSE_TIMEOUT
+        # Cleared by devices that stream their data once they have what they need
+        # for this poll, further notifications are then dropped straight away
+        self.accept_notify = True
+        # Resolved by notification_callback with the response to the current request
+        self._pending: asyncio.Future | None = None
+        # Notifications received during the current poll, logged once it ends
+        self._notif_count = 0
+        self._notif_bytes = 0
         self.ret_dev_data = []
+        # Set by the child classes when they create the entity with is_main=True
+        self._main_entity: RenogyDeviceData | None = None
         self.NOTIFY_SERVICE_UUID = None
         self.WRITE_SERVICE_UUID = None
         self.READ_OPERATION = 3
-        self.client = None
+        # The client is kept open between polls so the connection and GATT
+        # service discovery are only paid for on the first update
+        self.client: BleakClient | None = None
+        self._notify_started = False
+
+    def reset(self) -> None:
+        """Reset the per-poll state before the sections are read again."""
+        self.section_index = 0
+        self.accept_notify = True
+        self._notif_count = 0
+        self._notif_bytes = 0
+        self.ret_dev_data = []
+        self._main_entity = None
 
     def add_devices(self) -> None:
         """Add basic device information entities to the device data list.
@@ -81,80 +159,149 @@ class RenogyDevice(abc.ABC):
         to the ret_dev_data list for Home Assistant entity creation.
         """
 
-        for dev in self.ret_dev_data:
-            if dev.is_main:
-                dev.attributes["mac"] = self.mac
-                dev.attributes["device_name"] = self.device_name.strip()
-                dev.attributes["config_name"] = self.name
+        if self._main_entity is not None:
+            if self._main_entity.attributes is _EMPTY_ATTRIBUTES:
+                self._main_entity.attributes = {}
+            self._main_entity.attributes.update(
+                mac=self.mac,
+                device_name=self._stripped_device_name,
+                config_name=self.name,
+            )
+
+    def entity_templates(
+        self, entities: tuple, main_entity_id: int | None = None
+    ) -> tuple:
+        """Specialise a descriptor table for this device.
+
+        Each descriptor is (entity id, device id, device name, device type, name,
+        scale), a device name of None is this device and a scale of None keeps the
+        raw value. The device name and unique id are resolved once here so
+        build_entities only has to fill in the states. Returns the templates and
+        the position of the main entity among them, None if there is none.
+        """
+        templates = tuple(
+            (
+                device_id,
+                device_name or self.ha_device_name,
+                self.entity_unique_ids[entity_id],
+                device_type,
+                name,
+                scale,
+                entity_id == main_entity_id,
+            )
+            for entity_id, device_id, device_name, device_type, name, scale in entities
+        )
+        main_index = next(
+            (index for index, template in enumerate(templates) if template[-1]), None
+        )
+        return templates, main_index
+
+    def build_entities(self, templates: tuple, values: tuple) -> list[RenogyDeviceData]:
+        """Build the entities of a section from its templates and unpacked values.
+
+        Values are paired with the template at the same position.
+        """
+        templates, main_index = templates
+        ret_dev = [
+            RenogyDeviceData(
+                device_id=device_id,
+                device_name=device_name,
+                device_unique_id=unique_id,
+                device_type=device_type,
+                name=name,
+                state=value if scale is None else round(value * scale, 2),
+                is_main=is_main,
+            )
+            for (
+                device_id,
+                device_name,
+                unique_id,
+                device_type,
+                name,
+                scale,
+                is_main,
+            ), value in zip(templates, values)
+        ]
+        if main_index is not None:
+            self._main_entity = ret_dev[main_index]
+        return ret_dev
 
-    # If you want to change this value, also change the controller_name in api.py
     @property
     def device_unique_id(self) -> str:
         """Return the name of the controller."""
-        return "renogy_" + self.mac.lower().replace(":", "_") + "_id"
+        return self._device_unique_id
 
     async def notification_callback(
         self, characteristic: BleakGATTCharacteristic, data: bytearray
     ):
         """Handle notifications from the BLE device."""
+        if not self.accept_notify:
+            return
         # Part of step 3 below - recieve the responses from the device
-        operation = bytes_to_int(data, 1, 1)
-        _LOGGER.debug(
-            "%s - notification_callback %d - %d l:%d - %s", self.name,
-            operation,
-            self.section_index,
-            len(data),
-            data.hex(),
-        )
+        # The function code is a single byte, index it directly
+        operation = data[1] if len(data) > 1 else 0
+        # Only counted here, poll logs a summary once all the sections are read
+        self._notif_count += 1
+        self._notif_bytes += len(data)
 
         if operation == self.READ_OPERATION:
-            items = self.parse_section(data, self.section_index)
-            if items["valid"]:
-                self.ret_dev_data.extend(items["entities"])
-                # _LOGGER.debug("%s - ret_dev_data: %s", self.name, self.ret_dev_data)
-                self._notification_event.set()  # Trigger event
+            if self._pending is None or self._pending.done():
+                # No request waiting, a late or unrequested response
+                return
+
+            index = self.section_index
+            # A Modbus reply echoes the device id and carries the bytes of the words
+            # asked for, anything else answers an earlier request that timed out
+            if self.READ_OPERATION == self.function and (
+                len(data) < 3
+                or data[0] != self.device_id
+                or data[2] != 2 * self.SECTIONS[index][1]
+            ):
+                return
+            min_len = self.SECTION_MIN_LEN
+            if index < len(min_len) and len(data) < min_len[index]:
+                # Truncated frame, wait for the request to be sent again
+                return
+            items = self.parse_section(data, index)
+            if not items["valid"]:
+                return
+
+            self.ret_dev_data.extend(items["entities"])
+            # _LOGGER.debug("%s - ret_dev_data: %s", self.name, self.ret_dev_data)
+            self._pending.set_result(True)
         else:
             _LOGGER.warning(
                 "%s - Unknown operation response received, ignoring for now.  Looking for %d %d", self.name,
                 self.READ_OPERATION,
-                len(self.sections),
+                len(self.SECTIONS),
             )
 
     def create_generic_read_request(self, device_id, function, regAddr, readWrd):
         """Create a generic read request payload."""
         data = None
         if regAddr is not None and readWrd is not None:
-            data = []
-            data.append(device_id)
-            data.append(function)
-            data.append(int_to_bytes(regAddr, 0))
-            data.append(int_to_bytes(regAddr, 1))
-            data.append(int_to_bytes(readWrd, 0))
-            data.append(int_to_bytes(readWrd, 1))
-
-            crc = crc16_modbus(bytes(data))
-            data.append(crc[0])
-            data.append(crc[1])
+            # device id, function, register address and word count, big endian,
+            # followed by the 2 byte crc. Written into a single 8 byte buffer.
+            data = bytearray(8)
+            struct.pack_into(">BBHH", data, 0, device_id, function, regAddr, readWrd)
+            data[6:8] = crc16_modbus(memoryview(data)[:6])
             _LOGGER.debug("%s - create_request_payload %s => %s", self.name, regAddr, data)
         return data
 
     async def read_section(self, client: BleakClient):
         """Read a section of data from the BLE device."""
         index = self.section_index
-        if len(self.sections) == 0:
+        if len(self.SECTIONS) == 0:
             _LOGGER.error("RenogyDevice cannot be used directly")
 
-        self._notification_event.clear()  # Reset event before sending request
-
+        register, words = self.SECTIONS[index]
         request = self.create_generic_read_request(
             self.device_id,
             self.function,
-            self.sections[index]["register"],
-            self.sections[index]["words"],
-        )
-        await client.write_gatt_char(
-            self.WRITE_SERVICE_UUID, bytearray(request), response=False
+            register,
+            words,
         )
+        await client.write_gatt_char(self.WRITE_SERVICE_UUID, request, response=False)
 
     async def printServices(self, client: BleakClient):
         """Print all services, characteristics, and descriptors of the BLE device."""
@@ -166,98 +313,154 @@ class RenogyDevice(abc.ABC):
                 for desc in char.descriptors:
                     _LOGGER.debug("    -> Descriptor: %s", desc)
 
-    async def execute(self, ble_device: BLEDevice) -> list[RenogyDeviceData]:
-        """Execute the BLE communication."""
+    async def connect(self, ble_device: BLEDevice) -> None:
+        """Connect to the device and start notifications unless already done."""
+        if self.client is None or not self.client.is_connected:
+            self._notify_started = False
+            _LOGGER.debug("%s - Connecting to device %s", self.name, ble_device.address)
+            self.client = await establish_connection(
+                BleakClient, ble_device, ble_device.address
+            )
+
+            if not self.client.is_connected:
+                _LOGGER.error("%s - Failed to connect to device %s", self.name, ble_device.address)
+                self._raise_connection_error(ble_device.address)
+
+            # await self.printServices(self.client)
+
+        if not self._notify_started:
+            _LOGGER.debug("%s - Starting Notification for %s", self.name, self.NOTIFY_SERVICE_UUID)
+            await self.client.start_notify(
+                self.NOTIFY_SERVICE_UUID, self.notification_callback
+            )
+            self._notify_started = True
+
+    async def disconnect(self) -> None:
+        """Disconnect from the device if a connection is open."""
+        client = self.client
         self.client = None
+        self._notify_started = False
+        if client is not None:
+            await client.disconnect()
 
-        try:
-            if self.WRITE_SERVICE_UUID != "TEST":
-                if self.NOTIFY_SERVICE_UUID is None:
-                    _LOGGER.error("%s - No NOTIFY_SERVICE_UUID defined", self.name)
-                    return []
+    async def _request_section(self, client: BleakClient) -> None:
+        """Send the request for the current section and wait for its response."""
+        # A new future for every request, created before the request is sent
+        # so a fast response cannot be missed or answer a later request
+        self._pending = asyncio.get_running_loop().create_future()
 
-                countattempts = 0
-                self._notification_event.clear()
-                # Attempt the connection twice in the case the first connection has no successful data returned
-                while countattempts < 2 and not self._notification_event.is_set():
-                    if countattempts > 0:
-                        _LOGGER.warning("%s - Reconnecting to device %s", self.name, ble_device.address)
-                    else:
-                        _LOGGER.debug("%s - Connecting to device %s", self.name, ble_device.address)
-                    # Step 1 Connect to device
-                    self.client = await establish_connection(
-                        BleakClient, ble_device, ble_device.address
-                    )
-                    countattempts = countattempts + 1
+        # Step 2 Send data query (if needed)
+        if self.WRITE_SERVICE_UUID is not None:
+            await self.read_section(client)
 
-                    if not self.client.is_connected:
-                        _LOGGER.error("%s - Failed to connect to device %s", self.name, ble_device.address)
-                        self._raise_connection_error(ble_device.address)
+        # Step 3 wait for response (response recieved in notification_callback method)
+        await self._pending
 
-                    # await self.printServices(self.client)
+    async def _read_sections(self, client: BleakClient) -> None:
+        """Read every section through a connected client.
 
-                    _LOGGER.debug("%s - Starting Notification for %s", self.name, self.NOTIFY_SERVICE_UUID)
-                    await self.client.start_notify(
-                        self.NOTIFY_SERVICE_UUID, self.notification_callback
+        Each section is requested at most twice, raises DeviceCommunicationError
+        if the second request also gets no valid response in time.
+        """
+        # Process each section entry in sections
+        while self.section_index < len(self.SECTIONS):
+            try:
+                await asyncio.wait_for(
+                    self._request_section(client), self.response_timeout
+                )
+            except TimeoutError:
+                _LOGGER.debug(
+                    "%s - No response for section %d, retrying",
+                    self.name,
+                    self.section_index,
+                )
+                try:
+                    await asyncio.wait_for(
+                        self._request_section(client), self.response_timeout
                     )
+                except TimeoutError:
+                    self._raise_communication_error(self.mac)
 
-                    countsent = 0
-                    # Process each section entry in sections
-                    while countsent < 2 and self.section_index < len(self.sections):
-                        self._notification_event.clear()
-                        # Attempt to send and recieve at least two times in case data garbled or no response
-                        while countsent < 2 and not self._notification_event.is_set():
-                            # Step 2 Send data query (if needed)
-                            if self.WRITE_SERVICE_UUID is not None:
-                                await self.read_section(self.client)
-                            else:
-                                _LOGGER.debug("%s - No Write Service: %d", self.name, countsent)
-
-                            countwait = 0
-                            # Step 3 wait for response (response recieved in notification_callback method)
-                            while countwait < 30 and not self._notification_event.is_set():
-                                await asyncio.sleep(.2)
-                                countwait = countwait + 1
-
-                            _LOGGER.debug("%s - Event: %d - %d", self.name, self._notification_event.is_set(), countsent)
-                            countsent = countsent + 1
-
-                        if self._notification_event.is_set():
-                            # Data recieved go to next section
-                            self.section_index += 1
-                            countsent = 0
-                        else:
-                            # no data received
-                            if countattempts < 2:
-                                # Disconnect and reconnect to try one more time
-                                self.section_index = 0
-                                await self.client.disconnect()
-                                await asyncio.sleep(2)
-                            else:
-                                self._raise_communication_error(self.mac)
-
-                # Step 4 disconnect from the device
-                await self.client.disconnect()
-            else:
-                _LOGGER.warning("Simulated device - no BLE actions")
-                items = self.parse_section(b"ab232", self.section_index)
-
-                if items["valid"]:
-                    self.ret_dev_data.extend(items["entities"])
-                    self._notification_event.set()  # Trigger event
-                # _LOGGER.debug("ret_dev_data: %s", self.ret_dev_data)
-
-        except Exception as e:  # noqa: BLE001
-            _LOGGER.error("%s - Error processing device: %s", self.name, e)
-            traceback.print_exc()
-            # if connected - disconnect
-            if self.client is not None:
-                await self.client.disconnect()
-            return []
+            # Data recieved go to next section
+            self.section_index += 1
+
+    async def poll(self) -> list[RenogyDeviceData]:
+        """Read the device through its open connection.
+
+        Raises DeviceCommunicationError if a section could not be read.
+        """
+        self.reset()
+        await self._read_sections(self.client)
+        _LOGGER.debug(
+            "%s - received %d notifications, %d bytes total",
+            self.name,
+            self._notif_count,
+            self._notif_bytes,
+        )
 
         self.add_devices()
         return self.ret_dev_data
 
+    def _execute_simulated(self) -> list[RenogyDeviceData]:
+        """Parse canned data for a simulated device without any BLE actions."""
+        _LOGGER.warning("Simulated device - no BLE actions")
+        self.reset()
+        items = self.parse_section(b"ab232", self.section_index)
+
+        if items["valid"]:
+            self.ret_dev_data.extend(items["entities"])
+        # _LOGGER.debug("ret_dev_data: %s", self.ret_dev_data)
+
+        self.add_devices()
+        return self.ret_dev_data
+
+    async def execute(self, ble_device: BLEDevice) -> list[RenogyDeviceData]:
+        """Connect if needed and poll the device.
+
+        The connection stays open for the next call. A failed connection or read
+        is retried on a fresh connection, waiting twice as long after each failure.
+        """
+        if self.WRITE_SERVICE_UUID == "TEST":
+            return self._execute_simulated()
+
+        if self.NOTIFY_SERVICE_UUID is None:
+            _LOGGER.error("%s - No NOTIFY_SERVICE_UUID defined", self.name)
+            return []
+
+        countattempts = 0
+        delay = RECONNECT_DELAY
+        while True:
+            try:
+                # Step 1 Connect to device (reuses the open connection from the last poll)
+                await self.connect(ble_device)
+                # Step 2 and 3 request and receive each section
+                return await self.poll()
+            except (
+                BleakError,
+                DeviceConnectionError,
+                DeviceCommunicationError,
+            ) as e:
+                countattempts = countattempts + 1
+                # if connected - disconnect so the next attempt starts from a fresh connection
+                await self.disconnect()
+                if countattempts >= CONNECT_ATTEMPTS:
+                    _LOGGER.error("%s - Error processing device: %s", self.name, e)
+                    return []
+                _LOGGER.warning(
+                    "%s - Reconnecting to device %s in %.0fs: %s",
+                    self.name,
+                    ble_device.address,
+                    delay,
+                    e,
+                )
+                await asyncio.sleep(delay)
+                delay = delay * 2
+            except Exception as e:  # noqa: BLE001
+                _LOGGER.error("%s - Error processing device: %s", self.name, e)
+                traceback.print_exc()
+                await self.disconnect()
+                return []
+
     def validateLimits(self, value, min, max) -> bool:
         if value < min or value > max:
             return False
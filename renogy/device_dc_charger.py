@@ -5,379 +5,167 @@ and representing data from Renogy DC-DC Charger devices.
 """
 
 import logging
-
-from .device import RenogyDevice, RenogyDeviceData, RenogyDeviceType
-from .utils import bytes_to_int
+import struct
+import sys
+
+from .device import (
+    DEFAULT_DEVICE_ID,
+    INVALID_SECTION,
+    MAIN_BATTERY,
+    RenogyDevice,
+    RenogyDeviceData,
+    RenogyDeviceType,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 FUNCTION = {3: "READ", 6: "WRITE"}
 
-CHARGING_STATE = {
-    0: "deactivated",
-    1: "activated",
-    2: "mppt",
-    3: "equalizing",
-    4: "boost",
-    5: "floating",
-    6: "current limiting",
-    8: "alternator direct",
-}
-
-BATTERY_TYPE = {1: "open", 2: "sealed", 3: "gel", 4: "lithium", 5: "custom"}
+# Register layout of the charging info section, read from the start of the
+# payload (offset 3) with a single unpack. Unused registers are skipped.
+_CHG_INFO = struct.Struct(">3H2B6H2x3H2xH2xH2xH2x3HI4xI")
+
+_ALTERNATOR = sys.intern("Alternator")
+_SOLAR = sys.intern("Solar")
+
+# Entities of the charging info section in the order of the _CHG_INFO fields:
+# (entity id, device id, device name, device type, name, scale)
+# A device name of None is the charger itself.
+_CHG_INFO_ENTITIES = (
+    (3, 2, MAIN_BATTERY, RenogyDeviceType.PERCENTAGE, "Battery Percent", None),
+    (4, 2, MAIN_BATTERY, RenogyDeviceType.VOLTAGE_SENSOR, "Battery Voltage", 0.1),
+    (5, 1, None, RenogyDeviceType.CURRENT_SENSOR, "Combined Charge Current", 0.01),
+    (6, 1, None, RenogyDeviceType.TEMPERATURE_SENSOR, "Controller Temperature", None),
+    (7, 2, MAIN_BATTERY, RenogyDeviceType.TEMPERATURE_SENSOR, "Battery Temperature", None),
+    (8, 3, _ALTERNATOR, RenogyDeviceType.VOLTAGE_SENSOR, "Alternator Voltage", 0.1),
+    (9, 3, _ALTERNATOR, RenogyDeviceType.CURRENT_SENSOR, "Alternator Current", 0.01),
+    (10, 3, _ALTERNATOR, RenogyDeviceType.POWER_SENSOR, "Alternator Power", None),
+    (11, 4, _SOLAR, RenogyDeviceType.VOLTAGE_SENSOR, "Solar Voltage", 0.1),
+    (12, 4, _SOLAR, RenogyDeviceType.CURRENT_SENSOR, "Solar Current", 0.01),
+    (13, 4, _SOLAR, RenogyDeviceType.POWER_SENSOR, "Solar Power", None),
+    (14, 1, None, RenogyDeviceType.VOLTAGE_SENSOR, "Batt Min Voltage Today", 0.1),
+    (15, 1, None, RenogyDeviceType.VOLTAGE_SENSOR, "Batt Max Voltage Today", 0.1),
+    (16, 1, None, RenogyDeviceType.CURRENT_SENSOR, "Batt Max Current Today", 0.01),
+    (17, 1, None, RenogyDeviceType.POWER_SENSOR, "Batt Max Power Today", None),
+    (18, 1, None, RenogyDeviceType.AMP_HOURS_SENSOR, "Charging Amp Hours Today", None),
+    (19, 1, None, RenogyDeviceType.ENERGY_STORAGE, "Power Generation Today", None),
+    (20, 1, None, RenogyDeviceType.INT_DATA, "Total Working Days", None),
+    (21, 1, None, RenogyDeviceType.INT_DATA, "Count Battery Overdischarged", None),
+    (22, 1, None, RenogyDeviceType.INT_DATA, "Count Battery Fully Charged", None),
+    (23, 1, None, RenogyDeviceType.AMP_HOURS_SENSOR, "Total Battery AH Accumulated", None),
+    (24, 1, None, RenogyDeviceType.ENERGY_STORAGE, "Power Generation Total", None),
+)
+_CHG_INFO_MAIN_ENTITY = 5
+
+# Indexed by the register value, None for values without a name
+CHARGING_STATE = (
+    "deactivated",
+    "activated",
+    "mppt",
+    "equalizing",
+    "boost",
+    "floating",
+    "current limiting",
+    None,
+    "alternator direct",
+)
+
+BATTERY_TYPE = (None, "open", "sealed", "gel", "lithium", "custom")
 
 
 class DCChargerDevice(RenogyDevice):
     """Renogy DC-DC Charger device implementation."""
 
-    def __init__(self, mac: str, device_name: str, name: str) -> None:
+    SECTIONS = ((12, 8), (26, 1), (288, 3), (57348, 1), (256, 30))
+    SECTION_MIN_LEN = (19, 5, 3, 5, 3 + _CHG_INFO.size)
+
+    def __init__(
+        self,
+        mac: str,
+        device_name: str,
+        name: str,
+        device_id: int = DEFAULT_DEVICE_ID,
+    ) -> None:
         """Initialise."""
-        super().__init__(mac, device_name, name, device_type="DcDcCharger")
+        super().__init__(
+            mac, device_name, name, device_type="DcDcCharger", device_id=device_id
+        )
         self.NOTIFY_SERVICE_UUID = "0000fff1-0000-1000-8000-00805f9b34fb"
         self.WRITE_SERVICE_UUID = "0000ffd1-0000-1000-8000-00805f9b34fb"
         self.ha_device_name = "Renogy DC-DC Charger"
+        self._chg_info_templates = self.entity_templates(
+            _CHG_INFO_ENTITIES, _CHG_INFO_MAIN_ENTITY
+        )
         self.model = "Unknown"
         self.battery_type = "Unknown"
 
-        self.sections = [
-            {"register": 12, "words": 8},
-            {"register": 26, "words": 1},
-            {"register": 288, "words": 3},
-            {"register": 57348, "words": 1},
-            {"register": 256, "words": 30},
-        ]
+        # Parser for each entry of SECTIONS, in the same order
+        self._parsers = (
+            self.parse_device_info,
+            self.parse_device_address,
+            self.parse_state,
+            self.parse_battery_type,
+            self.parse_charging_info,
+        )
 
     def parse_section(self, bs: bytearray, section_index: int) -> dict:
         """Parse a section of data from the device."""
 
         # TODO: Validate checksum
-        if section_index == 0:
-            return self.parse_device_info(bs)
-        if section_index == 1:
-            return self.parse_device_address(bs)
-        if section_index == 2:
-            return self.parse_state(bs)
-        if section_index == 3:
-            return self.parse_battery_type(bs)
-        if section_index == 4:
-            return self.parse_charging_info(bs)
+        parsers = self._parsers
+        if section_index < len(parsers):
+            return parsers[section_index](bs)
 
-        return {"valid": False, "entities": []}
+        return INVALID_SECTION
 
     def parse_device_info(self, bs):
         """Parse device information from the device."""
-        self.model = (bs[3:19]).decode("utf-8").strip()
+        # str() decodes straight from the view, no copy of the model bytes
+        self.model = str(memoryview(bs)[3:19], "utf-8").strip()
         return {"valid": True, "entities": []}
 
     def parse_device_address(self, bs):
         """Parse the device address from the device."""
-        ret_dev = []
         entity_id = 2
         dev = RenogyDeviceData(
             device_id=1,
             device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
+            device_unique_id=self.entity_unique_ids[entity_id],
             device_type=RenogyDeviceType.INT_DATA,
             name="Device ID",
-            state=bytes_to_int(bs, 4, 1),
-            attributes={},
+            state=bs[4],
         )
-        ret_dev.append(dev)
-        return {"valid": True, "entities": ret_dev}
+        return {"valid": True, "entities": [dev]}
 
     def parse_charging_info(self, bs):
         """Parse charging information from the device."""
-        ret_dev = []
-        entity_id = 3
-        dev = RenogyDeviceData(
-            device_id=2,
-            device_name="Main Battery",
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.PERCENTAGE,
-            name="Battery Percent",
-            state=bytes_to_int(bs, 3, 2),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 4
-        dev = RenogyDeviceData(
-            device_id=2,
-            device_name="Main Battery",
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.VOLTAGE_SENSOR,
-            name="Battery Voltage",
-            state=bytes_to_int(bs, 5, 2, scale=0.1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 5
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.CURRENT_SENSOR,
-            name="Combined Charge Current",
-            state=bytes_to_int(bs, 7, 2, scale=0.01),
-            is_main=True,
-            attributes={
-                "model": self.model,
-                "battery_type": self.battery_type,
-            },
-        )
-        ret_dev.append(dev)
-
-        entity_id = 6
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.TEMPERATURE_SENSOR,
-            name="Controller Temperature",
-            state=bytes_to_int(bs, 9, 1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 7
-        dev = RenogyDeviceData(
-            device_id=2,
-            device_name="Main Battery",
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.TEMPERATURE_SENSOR,
-            name="Battery Temperature",
-            state=bytes_to_int(bs, 10, 1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 8
-        dev = RenogyDeviceData(
-            device_id=3,
-            device_name="Alternator",
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.VOLTAGE_SENSOR,
-            name="Alternator Voltage",
-            state=bytes_to_int(bs, 11, 2, scale=0.1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 9
-        dev = RenogyDeviceData(
-            device_id=3,
-            device_name="Alternator",
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.CURRENT_SENSOR,
-            name="Alternator Current",
-            state=bytes_to_int(bs, 13, 2, scale=0.01),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 10
-        dev = RenogyDeviceData(
-            device_id=3,
-            device_name="Alternator",
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.POWER_SENSOR,
-            name="Alternator Power",
-            state=bytes_to_int(bs, 15, 2),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 11
-        dev = RenogyDeviceData(
-            device_id=4,
-            device_name="Solar",
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.VOLTAGE_SENSOR,
-            name="Solar Voltage",
-            state=bytes_to_int(bs, 17, 2, scale=0.1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 12
-        dev = RenogyDeviceData(
-            device_id=4,
-            device_name="Solar",
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.CURRENT_SENSOR,
-            name="Solar Current",
-            state=bytes_to_int(bs, 19, 2, scale=0.01),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 13
-        dev = RenogyDeviceData(
-            device_id=4,
-            device_name="Solar",
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.POWER_SENSOR,
-            name="Solar Power",
-            state=bytes_to_int(bs, 21, 2),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 14
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.VOLTAGE_SENSOR,
-            name="Batt Min Voltage Today",
-            state=bytes_to_int(bs, 25, 2, scale=0.1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 15
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.VOLTAGE_SENSOR,
-            name="Batt Max Voltage Today",
-            state=bytes_to_int(bs, 27, 2, scale=0.1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 16
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.CURRENT_SENSOR,
-            name="Batt Max Current Today",
-            state=bytes_to_int(bs, 29, 2, scale=0.01),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 17
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.POWER_SENSOR,
-            name="Batt Max Power Today",
-            state=bytes_to_int(bs, 33, 2),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 18
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.AMP_HOURS_SENSOR,
-            name="Charging Amp Hours Today",
-            state=bytes_to_int(bs, 37, 2),
-            attributes={},
+        ret_dev = self.build_entities(
+            self._chg_info_templates, _CHG_INFO.unpack_from(bs, 3)
         )
-        ret_dev.append(dev)
-
-        entity_id = 19
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.ENERGY_STORAGE,
-            name="Power Generation Today",
-            state=bytes_to_int(bs, 41, 2),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 20
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.INT_DATA,
-            name="Total Working Days",
-            state=bytes_to_int(bs, 45, 2),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 21
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.INT_DATA,
-            name="Count Battery Overdischarged",
-            state=bytes_to_int(bs, 47, 2),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 22
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.INT_DATA,
-            name="Count Battery Fully Charged",
-            state=bytes_to_int(bs, 49, 2),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 23
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.AMP_HOURS_SENSOR,
-            name="Total Battery AH Accumulated",
-            state=bytes_to_int(bs, 51, 4),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 24
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.ENERGY_STORAGE,
-            name="Power Generation Total",
-            state=bytes_to_int(bs, 59, 4),
-            attributes={},
-        )
-        ret_dev.append(dev)
+        self._main_entity.attributes = {
+            "model": self.model,
+            "battery_type": self.battery_type,
+        }
 
         return {"valid": True, "entities": ret_dev}
 
     def parse_battery_type(self, bs):
         """Parse battery type from the device."""
-        self.battery_type = BATTERY_TYPE.get(bytes_to_int(bs, 3, 2))
+        value = int.from_bytes(bs[3:5], "big")
+        self.battery_type = BATTERY_TYPE[value] if value < len(BATTERY_TYPE) else None
         return {"valid": True, "entities": []}
 
     def parse_state(self, bs):
         """Parse device state from the device."""
-        ret_dev = []
-
         entity_id = 25
         dev = RenogyDeviceData(
             device_id=1,
             device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
+            device_unique_id=self.entity_unique_ids[entity_id],
             device_type=RenogyDeviceType.STRING_DATA,
             name="Charge State",
-            state=CHARGING_STATE.get(bytes_to_int(bs, 2, 1)),
-            attributes={},
+            state=CHARGING_STATE[bs[2]] if bs[2] < len(CHARGING_STATE) else None,
         )
-        ret_dev.append(dev)
 
         # alarms = {}
 
@@ -402,4 +190,4 @@ class DCChargerDevice(RenogyDevice):
         # key = next((key for key, value in alarms.items() if value > 0), None)
         # if (key != None): data['error'] = key
 
-        return {"valid": True, "entities": ret_dev}
+        return {"valid": True, "entities": [dev]}
@@ -6,14 +6,50 @@ This module provides:
 """
 
 import logging
+import struct
 
-from .device import RenogyDevice, RenogyDeviceData, RenogyDeviceType
-from .utils import bytes_to_int
+from .device import (
+    DEFAULT_DEVICE_ID,
+    INVALID_SECTION,
+    MAIN_BATTERY,
+    RenogyDevice,
+    RenogyDeviceData,
+    RenogyDeviceType,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 FUNCTION = {3: "READ", 6: "WRITE"}
 
+# Register layouts of the stats and load sections, read from the start of the
+# payload (offset 3) with a single unpack. Unused registers are skipped.
+_INVERTER_STATS = struct.Struct(">7H4xH")
+_LOAD_INFO = struct.Struct(">3H4xH")
+
+# Entities in the order of the _INVERTER_STATS fields:
+# (entity id, device id, device name, device type, name, scale)
+_INVERTER_STATS_ENTITIES = (
+    (3, 1, None, RenogyDeviceType.VOLTAGE_SENSOR, "Input Voltage", 0.1),
+    (4, 1, None, RenogyDeviceType.CURRENT_SENSOR, "Input Current", 0.01),
+    (5, 1, None, RenogyDeviceType.VOLTAGE_SENSOR, "Output Voltage", 0.1),
+    (6, 1, None, RenogyDeviceType.CURRENT_SENSOR, "Output Current", 0.01),
+    (7, 1, None, RenogyDeviceType.INT_DATA, "Output Frequency", 0.01),
+    (8, 2, MAIN_BATTERY, RenogyDeviceType.VOLTAGE_SENSOR, "Battery Voltage", 0.1),
+    (9, 1, None, RenogyDeviceType.TEMPERATURE_SENSOR, "Inverter Temperature", 0.1),
+    (10, 1, None, RenogyDeviceType.INT_DATA, "Input Frequency", 0.01),
+)
+_INVERTER_STATS_MAIN_ENTITY = 6
+
+# Entities in the order of the _LOAD_INFO fields:
+# (entity id, device id, device name, device type, name, scale)
+_LOAD_INFO_ENTITIES = (
+    (18, 1, None, RenogyDeviceType.CURRENT_SENSOR, "Load Current", 0.1),
+    (19, 1, None, RenogyDeviceType.POWER_SENSOR, "Load Active Power", None),
+    (20, 1, None, RenogyDeviceType.POWER_SENSOR, "Load Apparent Power", None),
+    # (21, 1, None, RenogyDeviceType.CURRENT_SENSOR, "Line Charging Current", 0.1),
+    (22, 1, None, RenogyDeviceType.PERCENTAGE, "Load Percentage", None),
+)
+
 CHARGING_STATE = {
     0: "deactivated",
     1: "constant current",
@@ -27,160 +63,80 @@ CHARGING_STATE = {
 class InverterDevice(RenogyDevice):
     """Renogy Inverter device implementation."""
 
-    def __init__(self, mac: str, device_name: str, name: str) -> None:
+    SECTIONS = (
+        (4311, 8),
+        (4109, 1),
+        (4000, 10),
+        (4408, 6),
+        # (4327, 7),
+    )
+    SECTION_MIN_LEN = (19, 5, 3 + _INVERTER_STATS.size, 3 + _LOAD_INFO.size)
+
+    def __init__(
+        self,
+        mac: str,
+        device_name: str,
+        name: str,
+        device_id: int = DEFAULT_DEVICE_ID,
+    ) -> None:
         """Initialise."""
-        super().__init__(mac, device_name, name, device_type="Inverter")
+        super().__init__(
+            mac, device_name, name, device_type="Inverter", device_id=device_id
+        )
         self.NOTIFY_SERVICE_UUID = "0000fff1-0000-1000-8000-00805f9b34fb"
         self.WRITE_SERVICE_UUID = "0000ffd1-0000-1000-8000-00805f9b34fb"
         self.ha_device_name = "Renogy Inverter"
+        self._inverter_stats_templates = self.entity_templates(
+            _INVERTER_STATS_ENTITIES, _INVERTER_STATS_MAIN_ENTITY
+        )
+        self._load_info_templates = self.entity_templates(_LOAD_INFO_ENTITIES)
         self.model = "Unknown"
 
-        self.sections = [
-            {"register": 4311, "words": 8},
-            {"register": 4109, "words": 1},
-            {"register": 4000, "words": 10},
-            {"register": 4408, "words": 6},
-            # {'register': 4327, 'words': 7},
-        ]
+        # Parser for each entry of SECTIONS, in the same order
+        self._parsers = (
+            self.parse_inverter_model,
+            self.parse_device_id,
+            self.parse_inverter_stats,
+            self.parse_load_info,
+            # self.parse_charging_info,
+        )
 
     def parse_section(self, bs: bytearray, section_index: int) -> dict:
         """Parse a section of data from the device."""
 
         # TODO: Validate checksum
-        if section_index == 0:
-            return self.parse_inverter_model(bs)
-        if section_index == 1:
-            return self.parse_device_id(bs)
-        if section_index == 2:
-            return self.parse_inverter_stats(bs)
-        if section_index == 3:
-            return self.parse_load_info(bs)
-        # if section_index == 4:
-        #     return self.parse_charging_info(bs)
-
-        return {"valid": False, "entities": []}
+        parsers = self._parsers
+        if section_index < len(parsers):
+            return parsers[section_index](bs)
+
+        return INVALID_SECTION
 
     def parse_inverter_model(self, bs):
         """Parse the inverter model from the device."""
-        self.model = (bs[3:19]).decode("utf-8").rstrip("\x00")
+        # str() decodes straight from the view, no copy of the model bytes
+        self.model = str(memoryview(bs)[3:19], "utf-8").rstrip("\x00")
 
         return {"valid": True, "entities": []}
 
     def parse_device_id(self, bs):
         """Parse the device ID from the device."""
-        ret_dev = []
         entity_id = 2
         dev = RenogyDeviceData(
             device_id=1,
             device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
+            device_unique_id=self.entity_unique_ids[entity_id],
             device_type=RenogyDeviceType.INT_DATA,
             name="Device ID",
-            state=bytes_to_int(bs, 3, 2),
-            attributes={},
+            state=int.from_bytes(bs[3:5], "big"),
         )
-        ret_dev.append(dev)
-        return {"valid": True, "entities": ret_dev}
+        return {"valid": True, "entities": [dev]}
 
     def parse_inverter_stats(self, bs):
         """Parse inverter statistics from the device."""
-        ret_dev = []
-        entity_id = 3
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.VOLTAGE_SENSOR,
-            name="Input Voltage",
-            state=bytes_to_int(bs, 3, 2, scale=0.1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 4
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.CURRENT_SENSOR,
-            name="Input Current",
-            state=bytes_to_int(bs, 5, 2, scale=0.01),
-            attributes={},
+        ret_dev = self.build_entities(
+            self._inverter_stats_templates, _INVERTER_STATS.unpack_from(bs, 3)
         )
-        ret_dev.append(dev)
-
-        entity_id = 5
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.VOLTAGE_SENSOR,
-            name="Output Voltage",
-            state=bytes_to_int(bs, 7, 2, scale=0.1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 6
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.CURRENT_SENSOR,
-            name="Output Current",
-            state=bytes_to_int(bs, 9, 2, scale=0.01),
-            is_main=True,
-            attributes={"model": self.model},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 7
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.INT_DATA,
-            name="Output Frequency",
-            state=bytes_to_int(bs, 11, 2, scale=0.01),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 8
-        dev = RenogyDeviceData(
-            device_id=2,
-            device_name="Main Battery",
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.VOLTAGE_SENSOR,
-            name="Battery Voltage",
-            state=bytes_to_int(bs, 13, 2, scale=0.1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 9
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.TEMPERATURE_SENSOR,
-            name="Inverter Temperature",
-            state=bytes_to_int(bs, 15, 2, scale=0.1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 10
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.INT_DATA,
-            name="Input Frequency",
-            state=bytes_to_int(bs, 21, 2, scale=0.01),
-            attributes={},
-        )
-        ret_dev.append(dev)
+        self._main_entity.attributes = {"model": self.model}
 
         return {"valid": True, "entities": ret_dev}
 
@@ -267,64 +223,8 @@ class InverterDevice(RenogyDevice):
 
     def parse_load_info(self, bs):
         """Parse load information from the device."""
-        ret_dev = []
-        entity_id = 18
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.CURRENT_SENSOR,
-            name="Load Current",
-            state=bytes_to_int(bs, 3, 2, scale=0.1),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 19
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.POWER_SENSOR,
-            name="Load Active Power",
-            state=bytes_to_int(bs, 5, 2),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 20
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.POWER_SENSOR,
-            name="Load Apparent Power",
-            state=bytes_to_int(bs, 7, 2),
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        # entity_id = 21
-        # dev = RenogyDeviceData(
-        #         device_id=1,
-        #         device_name=self.ha_device_name,
-        #         device_unique_id=self.device_unique_id + f"_{entity_id}",
-        #         device_type=RenogyDeviceType.CURRENT_SENSOR,
-        #         name='Line Charging Current',
-        #         state=bytes_to_int(bs, 11, 2, scale=0.1)
-        #     )
-        # ret_dev.append(dev)
-
-        entity_id = 22
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.PERCENTAGE,
-            name="Load Percentage",
-            state=bytes_to_int(bs, 13, 2),
-            attributes={},
+        ret_dev = self.build_entities(
+            self._load_info_templates, _LOAD_INFO.unpack_from(bs, 3)
         )
-        ret_dev.append(dev)
 
         return {"valid": True, "entities": ret_dev}
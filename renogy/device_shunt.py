@@ -5,146 +5,127 @@ from Renogy SmartShunt 300 devices via Bluetooth.
 """
 
 import logging
-
-from .device import RenogyDevice, RenogyDeviceData, RenogyDeviceType
-from .utils import bytes_to_int
-
+import struct
+
+from .device import (
+    DEFAULT_DEVICE_ID,
+    INVALID_SECTION,
+    STARTER_BATTERY,
+    RenogyDevice,
+    RenogyDeviceType,
+)
+
+# parse_section runs for every notification the shunt streams, keep its log
+# calls to lazy %-style arguments and guard any bs.hex() with isEnabledFor
 _LOGGER = logging.getLogger(__name__)
 
+# Fields of a shunt notification from offset 21: signed amps and volts are
+# 3 byte values, split in a high byte and a low word, then starter volts,
+# state of charge and temperature
+_SHUNT_DATA = struct.Struct(">BHxBH2xH2xH30xH")
+
+# Every shunt notification is exactly this long, merged or cut frames are dropped
+_SHUNT_FRAME_LEN = 110
+
+# Entities in the order of the values built from _SHUNT_DATA, already scaled:
+# (entity id, device id, device name, device type, name, scale)
+_SHUNT_ENTITIES = (
+    (1, 1, None, RenogyDeviceType.PERCENTAGE, "Main Battery Percent", None),
+    (2, 1, None, RenogyDeviceType.VOLTAGE_SENSOR, "Main Battery Voltage", None),
+    (3, 2, STARTER_BATTERY, RenogyDeviceType.VOLTAGE_SENSOR, "Starter Battery Voltage", None),
+    (4, 1, None, RenogyDeviceType.CURRENT_SENSOR, "Charge Amps", None),
+    (5, 1, None, RenogyDeviceType.POWER_SENSOR, "Charge Watts", None),
+    (6, 1, None, RenogyDeviceType.TEMPERATURE_SENSOR, "Main Battery Temperature", None),
+)
+_SHUNT_MAIN_ENTITY = 1
+
+# (min, max, description) a value must be within for the notification to be
+# used, None for values that are not checked
+_SHUNT_LIMITS = (
+    (0, 100, "battery percentage"),
+    (0, 20, "battery voltage"),
+    (0, 20, "starter battery voltage"),
+    (-300, 300, "battery amps"),
+    None,
+    (-20, 40, "battery temperature"),
+)
+
 # Read and parse Smart Shunt 300 specific data
 
 
 class ShuntDevice(RenogyDevice):
     """Renogy Smart Shunt 300 device implementation."""
 
-    def __init__(self, mac: str, device_name: str, name: str) -> None:
+    SECTIONS = ((256, 110),)
+
+    def __init__(
+        self,
+        mac: str,
+        device_name: str,
+        name: str,
+        device_id: int = DEFAULT_DEVICE_ID,
+    ) -> None:
         """Initialise."""
-        super().__init__(mac, device_name, name, device_type="SmartShunt300")
+        super().__init__(
+            mac, device_name, name, device_type="SmartShunt300", device_id=device_id
+        )
         self.NOTIFY_SERVICE_UUID = "0000c411-0000-1000-8000-00805f9b34fb"
         self.READ_OPERATION = 87
         self.ha_device_name = "Renogy Battery"
+        self._shunt_templates = self.entity_templates(
+            _SHUNT_ENTITIES, _SHUNT_MAIN_ENTITY
+        )
 
-        self.sections = [{"register": 256, "words": 110}]
-
-        # This flag is used to ensure we don't process 2 responses and duplicate device data
-        # The shunt does not wait for a write request it just keeps sending the data 
-        self.first_parse = True
+        # The shunt sends its data on its own schedule rather than on request,
+        # allow time for the next notification to arrive
+        self.response_timeout = 6.0
 
     def parse_section(self, bs: bytearray, section_index: int) -> dict:
         """Parse a section of data from the device."""
         
         # I'd like to validate the checksum but it seems to be non-standard and I can't figure it out.
-        if (
-            section_index != 0 or not self.first_parse or len(bs) != 110
-        ):  # The shunt sends many notifications in a row, we only need the first one
-            return {"valid": False, "entities": []}
-
-        # got a respose set flag
-        self.first_parse = False
-
-        ret_dev = []
-        entity_id = 1
-        value = bytes_to_int(bs, 34, 2, scale=0.1)  # 0xA6 (#1),
-        if not self.validateLimits(value, 0, 100):
-            _LOGGER.error("Invalid battery percentage: %f", value)
-            # Error seen reset flag
-            self.first_parse = True
-            return {"valid": False, "entities": []}
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.PERCENTAGE,
-            name="Main Battery Percent",
-            state=value,
-            is_main=True,
-            attributes={},
+        # notification_callback drops everything once accept_notify is cleared
+        if section_index != 0 or len(bs) != _SHUNT_FRAME_LEN:
+            return INVALID_SECTION
+
+        # got a respose, ignore the rest of the notifications until the next poll
+        # so the device data is not duplicated. The shunt does not wait for a
+        # write request it just keeps sending the data
+        self.accept_notify = False
+
+        (
+            amps_high,
+            amps_low,
+            volts_high,
+            volts_low,
+            starter_volts,
+            percent,
+            temperature,
+        ) = _SHUNT_DATA.unpack_from(bs, 21)
+        raw_volts = (volts_high << 16) | volts_low  # 0xA6 (#1)
+        raw_amps = (amps_high << 16) | amps_low  # 0xA4 (#1)
+        if raw_amps & 0x800000:
+            raw_amps -= 0x1000000
+        values = (
+            round(percent * 0.1, 2),  # 0xA6 (#1)
+            round(raw_volts * 0.001, 2),
+            round(starter_volts * 0.001, 2),  # 0xA6 (#2)
+            round(raw_amps * 0.001, 2),
+            # From the raw readings, so the rounding of volts and amps does not carry
+            round(raw_volts * raw_amps * 0.000001, 2),
+            round(temperature * 0.1, 2),  # 0xAD (#3)
         )
-        ret_dev.append(dev)
-
-        volts = bytes_to_int(bs, 25, 3, scale=0.001)  # 0xA6 (#1)
-        entity_id = 2
-        if not self.validateLimits(volts, 0, 20):
-            _LOGGER.error("Invalid battery voltage: %f", volts)
-            # Error seen reset flag
-            self.first_parse = True
-            return {"valid": False, "entities": []}
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.VOLTAGE_SENSOR,
-            name="Main Battery Voltage",
-            state=volts,
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 3
-        value = bytes_to_int(bs, 30, 2, scale=0.001) # 0xA6 (#2)
-        if not self.validateLimits(value, 0, 20):
-            _LOGGER.error("Invalid starter battery voltage: %f", value)
-            # Error seen reset flag
-            self.first_parse = True
-            return {"valid": False, "entities": []}
-        dev = RenogyDeviceData(
-            device_id=2,
-            device_name="Starter Battery",
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.VOLTAGE_SENSOR,
-            name="Starter Battery Voltage",
-            state=value,  
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        amps = bytes_to_int(bs, 21, 3, scale=0.001, signed=True)  # 0xA4 (#1)
-        entity_id = 4
-        if not self.validateLimits(amps, -300, 300):
-            _LOGGER.error("Invalid battery amps: %f", amps)
-            # Error seen reset flag
-            self.first_parse = True
-            return {"valid": False, "entities": []}
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.CURRENT_SENSOR,
-            name="Charge Amps",
-            state=amps,
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 5
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.POWER_SENSOR,
-            name="Charge Watts",
-            state=volts * amps,
-            attributes={},
-        )
-        ret_dev.append(dev)
-
-        entity_id = 6
-        value = bytes_to_int(bs, 66, 2, scale=0.1)  # 0xAD (#3
-        if not self.validateLimits(value, -20, 40):
-            _LOGGER.error("Invalid battery temperature: %f", value)
-            # Error seen reset flag
-            self.first_parse = True
-            return {"valid": False, "entities": []}
-        dev = RenogyDeviceData(
-            device_id=1,
-            device_name=self.ha_device_name,
-            device_unique_id=self.device_unique_id + f"_{entity_id}",
-            device_type=RenogyDeviceType.TEMPERATURE_SENSOR,
-            name="Main Battery Temperature",
-            state=value,
-            attributes={},
-        )
-        ret_dev.append(dev)
+
+        for value, limits in zip(values, _SHUNT_LIMITS):
+            if limits is None:
+                continue
+            if not self.validateLimits(value, limits[0], limits[1]):
+                _LOGGER.error("Invalid %s: %f", limits[2], value)
+                # Error seen reset flag
+                self.accept_notify = True
+                return INVALID_SECTION
+
+        ret_dev = self.build_entities(self._shunt_templates, values)
 
         # data['temperature_2'] = 0.00 if bytes_to_int(bs, 71, 1) == 0 else bytes_to_int(bs, 70, 3, scale = 0.001) # 0xAD (#4)
         # unknown values:
@@ -1,6 +1,9 @@
 """Interfaces with the Renogy Bluetooth Integration api sensors."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -28,6 +31,63 @@ from .renogy.device import RenogyDeviceData, RenogyDeviceType
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class SensorSpec:
+    """The fixed Home Assistant attributes of a kind of sensor."""
+
+    device_class: SensorDeviceClass | None
+    unit: str | None
+    state_class: SensorStateClass | None
+    # Converts the device state to the native value, None keeps it as is
+    caster: Callable[[Any], Any] | None
+
+
+# https://developers.home-assistant.io/docs/core/entity/sensor/#available-device-classes
+# https://developers.home-assistant.io/docs/core/entity/sensor/#available-state-classes
+# Device types without a spec have no sensor
+_SPEC_BY_TYPE: dict[RenogyDeviceType, SensorSpec] = {
+    RenogyDeviceType.TEMPERATURE_SENSOR: SensorSpec(
+        SensorDeviceClass.TEMPERATURE,
+        UnitOfTemperature.CELSIUS,
+        SensorStateClass.MEASUREMENT,
+        float,
+    ),
+    RenogyDeviceType.PERCENTAGE: SensorSpec(
+        SensorDeviceClass.BATTERY, PERCENTAGE, SensorStateClass.MEASUREMENT, float
+    ),
+    RenogyDeviceType.VOLTAGE_SENSOR: SensorSpec(
+        SensorDeviceClass.VOLTAGE,
+        UnitOfElectricPotential.VOLT,
+        SensorStateClass.MEASUREMENT,
+        float,
+    ),
+    RenogyDeviceType.CURRENT_SENSOR: SensorSpec(
+        SensorDeviceClass.CURRENT,
+        UnitOfElectricCurrent.AMPERE,
+        SensorStateClass.MEASUREMENT,
+        float,
+    ),
+    RenogyDeviceType.POWER_SENSOR: SensorSpec(
+        SensorDeviceClass.POWER,
+        UnitOfPower.WATT,
+        SensorStateClass.MEASUREMENT,
+        float,
+    ),
+    RenogyDeviceType.ENERGY_STORAGE: SensorSpec(
+        SensorDeviceClass.ENERGY_STORAGE,
+        UnitOfEnergy.WATT_HOUR,
+        SensorStateClass.MEASUREMENT,
+        float,
+    ),
+    # Home Assistant has no device class for amp hours
+    RenogyDeviceType.AMP_HOURS_SENSOR: SensorSpec(
+        None, "Ah", SensorStateClass.MEASUREMENT, float
+    ),
+    RenogyDeviceType.INT_DATA: SensorSpec(None, None, None, int),
+    RenogyDeviceType.STRING_DATA: SensorSpec(None, None, None, None),
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: MyConfigEntry,
@@ -40,36 +100,12 @@ async def async_setup_entry(
     # Enumerate all the sensors in your data value from your DataUpdateCoordinator and add an instance of your sensor class
     # to a list for each one.
     # This maybe different in your specific case, depending on how your data is structured
-    sensors = []
-
-    for device in coordinator.data.devices:
-        if device.device_type == RenogyDeviceType.TEMPERATURE_SENSOR:
-            ts = TemperatureSensor(coordinator, device)
-            sensors.append(ts)
-        if device.device_type == RenogyDeviceType.PERCENTAGE:
-            ts = PercentageSensor(coordinator, device)
-            sensors.append(ts)
-        if device.device_type == RenogyDeviceType.VOLTAGE_SENSOR:
-            ts = VoltageSensor(coordinator, device)
-            sensors.append(ts)
-        if device.device_type == RenogyDeviceType.CURRENT_SENSOR:
-            ts = CurrentSensor(coordinator, device)
-            sensors.append(ts)
-        if device.device_type == RenogyDeviceType.POWER_SENSOR:
-            ts = PowerSensor(coordinator, device)
-            sensors.append(ts)
-        if device.device_type == RenogyDeviceType.ENERGY_STORAGE:
-            ts = EnergyStorageSensor(coordinator, device)
-            sensors.append(ts)
-        if device.device_type == RenogyDeviceType.AMP_HOURS_SENSOR:
-            ts = AmpHourSensor(coordinator, device)
-            sensors.append(ts)
-        if device.device_type == RenogyDeviceType.INT_DATA:
-            ts = IntSensor(coordinator, device)
-            sensors.append(ts)
-        if device.device_type == RenogyDeviceType.STRING_DATA:
-            ts = StringSensor(coordinator, device)
-            sensors.append(ts)
+    class_by_type = _SENSOR_CLASS_BY_TYPE
+    sensors = [
+        sensor_class(coordinator, device)
+        for device in coordinator.data.devices
+        if (sensor_class := class_by_type.get(device.device_type)) is not None
+    ]
 
     # Create the sensors.
     async_add_entities(sensors)
@@ -96,79 +132,14 @@ def get_renogy_device_info(
     )
 
 
-class PowerSensor(CoordinatorEntity, SensorEntity):
-    """Implementation of a sensor."""
-
-    def __init__(
-        self, coordinator: RenogyCoordinator, device: RenogyDeviceData
-    ) -> None:
-        """Initialise sensor."""
-        super().__init__(coordinator)
-        self.device = device
-        self.device_id = device.device_id
-        # _LOGGER.debug("Init Device: %s", self.device)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
-        # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device_by_unique_id(
-            self.device.device_unique_id
-        )
-        # _LOGGER.debug("Update Device: %s", self.device)
-        self.async_write_ha_state()
-
-    @property
-    def device_class(self) -> str:
-        """Return device class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-device-classes
-        return SensorDeviceClass.POWER
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-
-        return get_renogy_device_info(self.coordinator, self.device)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self.device.name
-
-    @property
-    def native_value(self) -> int | float:
-        """Return the state of the entity."""
-        # Using native value and native unit of measurement, allows you to change units
-        # in Lovelace and HA will automatically calculate the correct value.
-        return float(self.device.state)
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return unit of temperature."""
-        return UnitOfPower.WATT
-
-    @property
-    def state_class(self) -> str | None:
-        """Return state class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-state-classes
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique id."""
-        # All entities must have a unique id.  Think carefully what you want this to be as
-        # changing it later will cause HA to create new entities.
-        return f"{DOMAIN}-{self.device.device_unique_id}"
-
-    @property
-    def extra_state_attributes(self):
-        """Return the extra state attributes."""
-        # Add any additional attributes you want on your sensor.
-        return self.device.attributes
+class RenogySensor(CoordinatorEntity, SensorEntity):
+    """Implementation of a sensor, each kind is a subclass made from its SensorSpec."""
 
+    # The Home Assistant base classes keep their __dict__, the slots only cover
+    # the per update fields of this class
+    __slots__ = ("device", "device_id", "_last_snapshot")
 
-class EnergyStorageSensor(CoordinatorEntity, SensorEntity):
-    """Implementation of a sensor."""
+    _caster: Callable[[Any], Any] | None = None
 
     def __init__(
         self, coordinator: RenogyCoordinator, device: RenogyDeviceData
@@ -177,528 +148,76 @@ class EnergyStorageSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.device = device
         self.device_id = device.device_id
-        # _LOGGER.debug("Init Device: %s", self.device)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
-        # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device_by_unique_id(
-            self.device.device_unique_id
-        )
-        # _LOGGER.debug("Update Device: %s", self.device)
-        self.async_write_ha_state()
-
-    @property
-    def device_class(self) -> str:
-        """Return device class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-device-classes
-        return SensorDeviceClass.ENERGY_STORAGE
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-
-        return get_renogy_device_info(self.coordinator, self.device)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self.device.name
-
-    @property
-    def native_value(self) -> int | float:
-        """Return the state of the entity."""
-        # Using native value and native unit of measurement, allows you to change units
-        # in Lovelace and HA will automatically calculate the correct value.
-        return float(self.device.state)
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return unit of temperature."""
-        return UnitOfEnergy.WATT_HOUR
-
-    @property
-    def state_class(self) -> str | None:
-        """Return state class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-state-classes
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique id."""
         # All entities must have a unique id.  Think carefully what you want this to be as
         # changing it later will cause HA to create new entities.
-        return f"{DOMAIN}-{self.device.device_unique_id}"
-
-    @property
-    def extra_state_attributes(self):
-        """Return the extra state attributes."""
+        self._attr_unique_id = f"{DOMAIN}-{device.device_unique_id}"
+        self._attr_name = device.name
+        self._attr_device_info = get_renogy_device_info(coordinator, device)
         # Add any additional attributes you want on your sensor.
-        return self.device.attributes
-
-
-class AmpHourSensor(CoordinatorEntity, SensorEntity):
-    """Implementation of a sensor."""
-
-    def __init__(
-        self, coordinator: RenogyCoordinator, device: RenogyDeviceData
-    ) -> None:
-        """Initialise sensor."""
-        super().__init__(coordinator)
-        self.device = device
-        self.device_id = device.device_id
+        self._attr_extra_state_attributes = device.attributes
+        self._update_native_value()
+        # Adding the entity writes the initial state
+        self._last_snapshot = self._snapshot()
         # _LOGGER.debug("Init Device: %s", self.device)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update sensor with latest data from coordinator."""
         # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device_by_unique_id(
+        device = self.coordinator.get_device_by_unique_id(
             self.device.device_unique_id
         )
+        # A device that dropped out of this update keeps its last state
+        if device is not None:
+            self.device = device
+            # Unique ids are positional, the entity behind one can be renamed
+            self._attr_name = device.name
+            self._update_native_value()
+        # Most polls repeat the last readings, only write the state when it changed
+        snapshot = self._snapshot()
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+        self._attr_extra_state_attributes = self.device.attributes
         # _LOGGER.debug("Update Device: %s", self.device)
         self.async_write_ha_state()
 
-    # @property
-    # def device_class(self) -> str:
-    #     """Return device class."""
-    #     # https://developers.home-assistant.io/docs/core/entity/sensor/#available-device-classes
-    #     return SensorDeviceClass.ENERGY_STORAGE
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-
-        return get_renogy_device_info(self.coordinator, self.device)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self.device.name
-
-    @property
-    def native_value(self) -> int | float:
-        """Return the state of the entity."""
-        # Using native value and native unit of measurement, allows you to change units
-        # in Lovelace and HA will automatically calculate the correct value.
-        return float(self.device.state)
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return unit of temperature."""
-        return "Ah"
-
-    @property
-    def state_class(self) -> str | None:
-        """Return state class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-state-classes
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique id."""
-        # All entities must have a unique id.  Think carefully what you want this to be as
-        # changing it later will cause HA to create new entities.
-        return f"{DOMAIN}-{self.device.device_unique_id}"
-
-    @property
-    def extra_state_attributes(self):
-        """Return the extra state attributes."""
-        # Add any additional attributes you want on your sensor.
-        return self.device.attributes
-
-
-class CurrentSensor(CoordinatorEntity, SensorEntity):
-    """Implementation of a sensor."""
-
-    def __init__(
-        self, coordinator: RenogyCoordinator, device: RenogyDeviceData
-    ) -> None:
-        """Initialise sensor."""
-        super().__init__(coordinator)
-        self.device = device
-        self.device_id = device.device_id
-        # _LOGGER.debug("Init Device: %s", self.device)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
-        # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device_by_unique_id(
-            self.device.device_unique_id
-        )
-        # _LOGGER.debug("Update Device: %s", self.device)
-        self.async_write_ha_state()
-
-    @property
-    def device_class(self) -> str:
-        """Return device class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-device-classes
-        return SensorDeviceClass.CURRENT
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-
-        return get_renogy_device_info(self.coordinator, self.device)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self.device.name
-
-    @property
-    def native_value(self) -> int | float:
-        """Return the state of the entity."""
-        # Using native value and native unit of measurement, allows you to change units
-        # in Lovelace and HA will automatically calculate the correct value.
-        return float(self.device.state)
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return unit of temperature."""
-        return UnitOfElectricCurrent.AMPERE
-
-    @property
-    def state_class(self) -> str | None:
-        """Return state class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-state-classes
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique id."""
-        # All entities must have a unique id.  Think carefully what you want this to be as
-        # changing it later will cause HA to create new entities.
-        return f"{DOMAIN}-{self.device.device_unique_id}"
-
-    @property
-    def extra_state_attributes(self):
-        """Return the extra state attributes."""
-        # Add any additional attributes you want on your sensor.
-        return self.device.attributes
-
-
-class VoltageSensor(CoordinatorEntity, SensorEntity):
-    """Implementation of a sensor."""
-
-    def __init__(
-        self, coordinator: RenogyCoordinator, device: RenogyDeviceData
-    ) -> None:
-        """Initialise sensor."""
-        super().__init__(coordinator)
-        self.device = device
-        self.device_id = device.device_id
-        # _LOGGER.debug("Init Device: %s", self.device)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
-        # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device_by_unique_id(
-            self.device.device_unique_id
+    def _snapshot(self) -> tuple:
+        """Return what the written state depends on."""
+        # A failed poll hands back the previous data, availability tells it apart
+        return (
+            self.available,
+            self._attr_name,
+            self._attr_native_value,
+            self.device.attributes,
         )
-        # _LOGGER.debug("Update Device: %s", self.device)
-        self.async_write_ha_state()
-
-    @property
-    def device_class(self) -> str:
-        """Return device class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-device-classes
-        return SensorDeviceClass.VOLTAGE
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-
-        return get_renogy_device_info(self.coordinator, self.device)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self.device.name
-
-    @property
-    def native_value(self) -> int | float:
-        """Return the state of the entity."""
+    def _update_native_value(self) -> None:
+        """Cast the device state to the native value once per update."""
         # Using native value and native unit of measurement, allows you to change units
         # in Lovelace and HA will automatically calculate the correct value.
-        return float(self.device.state)
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return unit of temperature."""
-        return UnitOfElectricPotential.VOLT
-
-    @property
-    def state_class(self) -> str | None:
-        """Return state class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-state-classes
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique id."""
-        # All entities must have a unique id.  Think carefully what you want this to be as
-        # changing it later will cause HA to create new entities.
-        return f"{DOMAIN}-{self.device.device_unique_id}"
-
-    @property
-    def extra_state_attributes(self):
-        """Return the extra state attributes."""
-        # Add any additional attributes you want on your sensor.
-        return self.device.attributes
-
-
-class PercentageSensor(CoordinatorEntity, SensorEntity):
-    """Implementation of a sensor."""
-
-    def __init__(
-        self, coordinator: RenogyCoordinator, device: RenogyDeviceData
-    ) -> None:
-        """Initialise sensor."""
-        super().__init__(coordinator)
-        self.device = device
-        self.device_id = device.device_id
-        # _LOGGER.debug("Init Device: %s", self.device)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
-        # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device_by_unique_id(
-            self.device.device_unique_id
-        )
-        # _LOGGER.debug("Update Device: %s", self.device)
-        self.async_write_ha_state()
-
-    @property
-    def device_class(self) -> str:
-        """Return device class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-device-classes
-        return SensorDeviceClass.BATTERY
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-
-        return get_renogy_device_info(self.coordinator, self.device)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self.device.name
-
-    @property
-    def native_value(self) -> int | float:
-        """Return the state of the entity."""
-        # Using native value and native unit of measurement, allows you to change units
-        # in Lovelace and HA will automatically calculate the correct value.
-        return float(self.device.state)
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return unit of temperature."""
-        return PERCENTAGE
-
-    @property
-    def state_class(self) -> str | None:
-        """Return state class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-state-classes
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique id."""
-        # All entities must have a unique id.  Think carefully what you want this to be as
-        # changing it later will cause HA to create new entities.
-        return f"{DOMAIN}-{self.device.device_unique_id}"
-
-    @property
-    def extra_state_attributes(self):
-        """Return the extra state attributes."""
-        # Add any additional attributes you want on your sensor.
-        return self.device.attributes
-
-
-class TemperatureSensor(CoordinatorEntity, SensorEntity):
-    """Implementation of a sensor."""
-
-    def __init__(
-        self, coordinator: RenogyCoordinator, device: RenogyDeviceData
-    ) -> None:
-        """Initialise sensor."""
-        super().__init__(coordinator)
-        self.device = device
-        self.device_id = device.device_id
-        # _LOGGER.debug("Init Device: %s", self.device)
-        # Device(device_id=1, device_unique_id='C4_D3_6A_93_B2_3B_T1', device_type=<DeviceType.TEMPERATURE_SENSOR: 'TEMPERATURE_SENSOR'>, name='Temp Sensor 1', state=17)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
-        # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device_by_unique_id(
-            self.device.device_unique_id
-        )
-        # _LOGGER.debug("Update Device: %s", self.device)
-        self.async_write_ha_state()
-
-    @property
-    def device_class(self) -> str:
-        """Return device class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-device-classes
-        return SensorDeviceClass.TEMPERATURE
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-
-        return get_renogy_device_info(self.coordinator, self.device)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self.device.name
-
-    @property
-    def native_value(self) -> int | float:
-        """Return the state of the entity."""
-        # Using native value and native unit of measurement, allows you to change units
-        # in Lovelace and HA will automatically calculate the correct value.
-        return float(self.device.state)
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return unit of temperature."""
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def state_class(self) -> str | None:
-        """Return state class."""
-        # https://developers.home-assistant.io/docs/core/entity/sensor/#available-state-classes
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique id."""
-        # All entities must have a unique id.  Think carefully what you want this to be as
-        # changing it later will cause HA to create new entities.
-        return f"{DOMAIN}-{self.device.device_unique_id}"
-
-    @property
-    def extra_state_attributes(self):
-        """Return the extra state attributes."""
-        # Add any additional attributes you want on your sensor.
-        return self.device.attributes
-
-
-class IntSensor(CoordinatorEntity, SensorEntity):
-    """Implementation of a sensor."""
-
-    def __init__(
-        self, coordinator: RenogyCoordinator, device: RenogyDeviceData
-    ) -> None:
-        """Initialise sensor."""
-        super().__init__(coordinator)
-        self.device = device
-        self.device_id = device.device_id
-        # _LOGGER.debug("Init Device: %s", self.device)
-        # Device(device_id=1, device_unique_id='C4_D3_6A_93_B2_3B_T1', device_type=<DeviceType.TEMPERATURE_SENSOR: 'TEMPERATURE_SENSOR'>, name='Temp Sensor 1', state=17)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
-        # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device_by_unique_id(
-            self.device.device_unique_id
-        )
-        # _LOGGER.debug("Update Device: %s", self.device)
-        self.async_write_ha_state()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-
-        return get_renogy_device_info(self.coordinator, self.device)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self.device.name
-
-    @property
-    def native_value(self) -> int:
-        """Return the state of the entity."""
-        # Using native value and native unit of measurement, allows you to change units
-        # in Lovelace and HA will automatically calculate the correct value.
-        return int(self.device.state)
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique id."""
-        # All entities must have a unique id.  Think carefully what you want this to be as
-        # changing it later will cause HA to create new entities.
-        return f"{DOMAIN}-{self.device.device_unique_id}"
-
-    @property
-    def extra_state_attributes(self):
-        """Return the extra state attributes."""
-        # Add any additional attributes you want on your sensor.
-        return self.device.attributes
-
-
-class StringSensor(CoordinatorEntity, SensorEntity):
-    """Implementation of a sensor."""
-
-    def __init__(
-        self, coordinator: RenogyCoordinator, device: RenogyDeviceData
-    ) -> None:
-        """Initialise sensor."""
-        super().__init__(coordinator)
-        self.device = device
-        self.device_id = device.device_id
-        # _LOGGER.debug("Init Device: %s", self.device)
-        # Device(device_id=1, device_unique_id='C4_D3_6A_93_B2_3B_T1', device_type=<DeviceType.TEMPERATURE_SENSOR: 'TEMPERATURE_SENSOR'>, name='Temp Sensor 1', state=17)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
-        # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device_by_unique_id(
-            self.device.device_unique_id
-        )
-        # _LOGGER.debug("Update Device: %s", self.device)
-        self.async_write_ha_state()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-
-        return get_renogy_device_info(self.coordinator, self.device)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self.device.name
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the entity."""
-        # Using native value and native unit of measurement, allows you to change units
-        # in Lovelace and HA will automatically calculate the correct value.
-        return self.device.state
+        if self._caster is None:
+            self._attr_native_value = self.device.state
+        else:
+            self._attr_native_value = self._caster(self.device.state)
+
+
+def _sensor_class(device_type: RenogyDeviceType, spec: SensorSpec) -> type:
+    """Return the RenogySensor subclass holding the attributes of a spec."""
+    return type(
+        "Renogy" + device_type.title().replace("_", ""),
+        (RenogySensor,),
+        {
+            "__slots__": (),
+            "_attr_device_class": spec.device_class,
+            "_attr_native_unit_of_measurement": spec.unit,
+            "_attr_state_class": spec.state_class,
+            "_caster": None if spec.caster is None else staticmethod(spec.caster),
+        },
+    )
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique id."""
-        # All entities must have a unique id.  Think carefully what you want this to be as
-        # changing it later will cause HA to create new entities.
-        return f"{DOMAIN}-{self.device.device_unique_id}"
 
-    @property
-    def extra_state_attributes(self):
-        """Return the extra state attributes."""
-        # Add any additional attributes you want on your sensor.
-        return self.device.attributes
+_SENSOR_CLASS_BY_TYPE: dict[RenogyDeviceType, type[RenogySensor]] = {
+    device_type: _sensor_class(device_type, spec)
+    for device_type, spec in _SPEC_BY_TYPE.items()
+}